@@ -212,9 +212,7 @@ def int_to_hex(i: int, length: int=1) -> str:
     if i < 0:
         # two's complement
         i = range_size + i
-    s = hex(i)[2:].rstrip('L')
-    s = "0"*(2*length - len(s)) + s
-    return rev_hex(s)
+    return i.to_bytes(length, 'little').hex()
 
 def script_num_to_hex(i: int) -> str:
     """See CScriptNum in Bitcoin Core.
@@ -460,6 +458,10 @@ assert len(__b58chars) == 58
 __b43chars = b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ$*+-./:'
 assert len(__b43chars) == 43
 
+# byte value -> digit, for base_decode
+__b58digits = {c: i for i, c in enumerate(__b58chars)}
+__b43digits = {c: i for i, c in enumerate(__b43chars)}
+
 
 class BaseDecodeError(BitcoinException): pass
 
@@ -504,34 +506,28 @@ def base_decode(v: Union[bytes, str], *, base: int, length: int = None) -> Optio
     if base not in (58, 43):
         raise ValueError('not supported base: {}'.format(base))
     chars = __b58chars
+    digits = __b58digits
     if base == 43:
         chars = __b43chars
+        digits = __b43digits
     long_value = 0
-    power_of_base = 1
-    for c in v[::-1]:
-        digit = chars.find(bytes([c]))
-        if digit == -1:
+    for c in v:
+        digit = digits.get(c)
+        if digit is None:
             raise BaseDecodeError('Forbidden character {} for base {}'.format(c, base))
-        # naive but slow variant:   long_value += digit * (base**i)
-        long_value += digit * power_of_base
-        power_of_base *= base
-    result = bytearray()
-    while long_value >= 256:
-        div, mod = divmod(long_value, 256)
-        result.append(mod)
-        long_value = div
-    result.append(long_value)
+        long_value = long_value * base + digit
+    # int.to_bytes instead of a divmod loop, which is quadratic in len(v)
+    result = long_value.to_bytes(max(1, (long_value.bit_length() + 7) // 8), 'big')
     nPad = 0
     for c in v:
         if c == chars[0]:
             nPad += 1
         else:
             break
-    result.extend(b'\x00' * nPad)
+    result = b'\x00' * nPad + result
     if length is not None and len(result) != length:
         return None
-    result.reverse()
-    return bytes(result)
+    return result
 
 
 class InvalidChecksum(BaseDecodeError):
@@ -23,7 +23,8 @@
 import os
 import threading
 import time
-from typing import Optional, Dict, Mapping, Sequence
+from collections import OrderedDict
+from typing import Optional, Dict, Mapping, Sequence, Iterator
 
 from . import constants, util
 from .bitcoin import hash_encode, int_to_hex, rev_hex
@@ -39,6 +40,7 @@ _logger = get_logger(__name__)
 
 HEADER_SIZE = 1487  # bytes
 MAX_TARGET = 0x0007FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+READ_HEADER_CACHE_SIZE = 1024  # parsed headers kept per Blockchain
 POW_AVERAGING_WINDOW = 17
 POW_MEDIAN_BLOCK_SPAN = 11
 POW_MAX_ADJUST_DOWN = 32
@@ -212,6 +214,7 @@ class Blockchain(Logger):
         self._forkpoint_hash = forkpoint_hash  # blockhash at forkpoint. "first hash"
         self._prev_hash = prev_hash  # blockhash immediately before forkpoint
         self.lock = threading.RLock()
+        self._header_cache = OrderedDict()  # type: Dict[int, Optional[dict]]  # in LRU order
         self.update_size()
 
     def with_lock(func):
@@ -314,6 +317,8 @@ class Blockchain(Logger):
     def update_size(self) -> None:
         p = self.path()
         self._size = os.path.getsize(p)//HEADER_SIZE if os.path.exists(p) else 0
+        # headers file was changed
+        self._header_cache.clear()
 
     @classmethod
     def verify_header(cls, header: dict, prev_hash: str, target: int, expected_header_hash: str=None) -> None:
@@ -495,6 +500,9 @@ class Blockchain(Logger):
             return self.parent.read_header(height)
         if height > self.height():
             return
+        if height in self._header_cache:
+            self._header_cache.move_to_end(height)
+            return self._copy_header(self._header_cache[height])
         delta = height - self.forkpoint
         name = self.path()
         self.assert_headers_file_available(name)
@@ -504,8 +512,47 @@ class Blockchain(Logger):
             if len(h) < HEADER_SIZE:
                 raise Exception('Expected to read a full header. This was only {} bytes'.format(len(h)))
         if h == bytes([0])*HEADER_SIZE:
-            return None
-        return deserialize_header(h, height)
+            header = None
+        else:
+            header = deserialize_header(h, height)
+        self._header_cache[height] = header
+        if len(self._header_cache) > READ_HEADER_CACHE_SIZE:
+            self._header_cache.popitem(last=False)
+        return self._copy_header(header)
+
+    @staticmethod
+    def _copy_header(header: Optional[dict]) -> Optional[dict]:
+        # callers own the header they get and may modify it (hash_header does),
+        # so never hand out the cached dict itself
+        return dict(header) if header is not None else None
+
+    def iter_headers(self, end_height: int) -> Iterator[Optional[dict]]:
+        """Yield headers from height 0 up to end_height (exclusive) or the tip,
+        as read_header would, but reading each headers file only once.
+        """
+        if end_height <= 0:
+            return
+        if self.forkpoint > 0:
+            yield from self.parent.iter_headers(min(end_height, self.forkpoint))
+        with self.lock:
+            end_height = min(end_height, self.height() + 1)
+            if end_height <= self.forkpoint:
+                return
+            name = self.path()
+            self.assert_headers_file_available(name)
+            with open(name, 'rb') as f:
+                data = f.read((end_height - self.forkpoint) * HEADER_SIZE)
+        data = memoryview(data)  # slice headers without copying
+        empty_header = bytes([0])*HEADER_SIZE
+        for height in range(self.forkpoint, end_height):
+            delta = height - self.forkpoint
+            h = data[delta*HEADER_SIZE : (delta+1)*HEADER_SIZE]
+            if len(h) < HEADER_SIZE:
+                raise Exception('Expected to read a full header. This was only {} bytes'.format(len(h)))
+            if h == empty_header:
+                yield None
+            else:
+                yield deserialize_header(h, height)
 
     def header_at_tip(self) -> Optional[dict]:
         """Return latest header."""
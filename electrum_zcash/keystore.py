@@ -437,6 +437,12 @@ class MasterPublicKeyMixin(ABC):
         return der_suffix if only_der_suffix else full_path
 
 
+@lru_cache(maxsize=256)
+def _bip32_node_from_xpub(xpub: str, *, net) -> BIP32Node:
+    # only xpubs are cached here, to not keep private keys around in memory
+    return BIP32Node.from_xkey(xpub, net=net)
+
+
 class Xpub(MasterPublicKeyMixin):
 
     def __init__(self, *, derivation_prefix: str = None, root_fingerprint: str = None):
@@ -542,7 +548,8 @@ class Xpub(MasterPublicKeyMixin):
 
     @classmethod
     def get_pubkey_from_xpub(self, xpub: str, sequence) -> bytes:
-        node = BIP32Node.from_xkey(xpub).subkey_at_public_derivation(sequence)
+        node = _bip32_node_from_xpub(xpub, net=constants.net)
+        node = node.subkey_at_public_derivation(sequence)
         return node.eckey.get_public_key_bytes(compressed=True)
 
 
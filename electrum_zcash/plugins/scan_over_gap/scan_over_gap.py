@@ -3,9 +3,9 @@
 
 import asyncio
 import attr
-from functools import partial
-from collections import OrderedDict
+from collections import defaultdict
 from enum import IntEnum
+from functools import partial
 
 from aiorpcx import TaskGroup
 
@@ -22,8 +22,8 @@ def balance_total(*, confirmed, unconfirmed):
 
 @attr.s
 class Scan:
-    derive = attr.ib(kw_only=True)
-    create_addr = attr.ib(kw_only=True)
+    derive_address = attr.ib(kw_only=True)
+    create_new_address = attr.ib(kw_only=True)
     num_addrs = attr.ib(kw_only=True)
     gap = attr.ib(kw_only=True)
     start_idx = attr.ib(kw_only=True)
@@ -36,16 +36,21 @@ class Scan:
     active = attr.ib(kw_only=True, default=True)
 
     def derive_addrs(self, cnt):
-        for i in range(self.next_idx, self.next_idx + cnt):
-            self.addrs[i] = self.derive(i)
+        derive_address = self.derive_address
+        for_change = self.for_change
+        # merge at once, so self.addrs is resized a single time
+        self.addrs.update({i: derive_address(for_change, i)
+                           for i in range(self.next_idx, self.next_idx + cnt)})
         self.next_idx += cnt
 
     def create_new_addrs(self, wallet):
+        if not self.has_found:
+            return
         for i, balance in self.balances.items():
             if balance > 0:
                 with wallet.lock:
                     while self.start_idx <= i + self.gap:
-                        addr = self.create_addr()
+                        addr = self.create_new_address(bool(self.for_change))
                         if i not in self.addrs:
                             self.addrs[i] = addr
                         self.start_idx = self.num_addrs()
@@ -53,6 +58,10 @@ class Scan:
                             self.next_idx = self.start_idx
             self.balances[i] = 0
 
+    @property
+    def has_found(self):
+        return any(b > 0 for b in self.balances.values())
+
     @property
     def uncompleted(self):
         return set(self.addrs) - set(self.balances)
@@ -78,7 +87,8 @@ class Scan:
 class WalletScan:
     progress = attr.ib(kw_only=True, default=0)
     running = attr.ib(kw_only=True, default=False)
-    scans = attr.ib(kw_only=True, default=attr.Factory(OrderedDict))
+    scans = attr.ib(kw_only=True, default=attr.Factory(dict))
+    scan_list = attr.ib(kw_only=True, default=attr.Factory(list))
     error = attr.ib(kw_only=True, default=None)
 
 
@@ -158,25 +168,38 @@ class ScanOverGapPlugin(BasePlugin, Logger):
             if not ws:
                 self.wallet_scans[w] = ws = WalletScan()
             for for_change in [0, 1]:
-                b_chg = bool(for_change)
                 key = Scan.get_key(for_change=for_change)
                 if key not in ws.scans:
-                    derive = partial(w.derive_address, for_change)
-                    create_addr = partial(w.create_new_address, b_chg)
-                    num_addrs = (partial(db_num_change)
-                                 if for_change else
-                                 partial(db_num_receiving))
+                    num_addrs = (db_num_change if for_change
+                                 else db_num_receiving)
                     gap = w.gap_limit_for_change if for_change else w.gap_limit
                     start_idx = num_addrs()
-                    s = Scan(derive=derive, create_addr=create_addr,
+                    s = Scan(derive_address=w.derive_address,
+                             create_new_address=w.create_new_address,
                              num_addrs=num_addrs, gap=gap,
                              start_idx=start_idx, next_idx=start_idx,
                              for_change=for_change)
                     new_scans_cnt +=1
                     ws.scans[key] = s
+                    ws.scan_list.append(s)
         return new_scans_cnt
 
-    async def do_scan(self, wallet, cnt):
+    def on_balance_done(self, targets, task):
+        try:
+            balance = balance_total(**task.result())
+            e = None
+        except BaseException as exc:
+            self.logger.info(f'Exception on get_balance {repr(exc)}')
+            e = exc
+        for s, i in targets:
+            s.tasks.pop(i, None)
+            if e is None:
+                s.balances[i] = balance
+                s.errors.pop(i, None)
+            else:
+                s.errors[i] = e
+
+    async def do_scan(self, wallet, cnt, *, derive_new=True):
         w = wallet
         try:
             async with self.wallet_scans_lock:
@@ -184,7 +207,7 @@ class ScanOverGapPlugin(BasePlugin, Logger):
                 if not ws or ws.running:
                     return
                 ws.running = True
-                scans = list(ws.scans.values())
+                scans = ws.scan_list
             n = Network.get_instance()
             loop = n.asyncio_loop
             done_cnt = 0
@@ -195,42 +218,40 @@ class ScanOverGapPlugin(BasePlugin, Logger):
                 to_scan_cnt += len(s.uncompleted)
             if to_scan_cnt:
                 self.logger.info(f'total count to rescan: {to_scan_cnt}')
-            else:
+            elif derive_new:
                 for s in scans:
                     if not s.active:
                         continue
-                    async with self.wallet_scans_lock:
-                        await loop.run_in_executor(None, s.derive_addrs, cnt)
+                    await loop.run_in_executor(None, s.derive_addrs, cnt)
                     to_scan_cnt += cnt
                 self.logger.info(f'total count to scan: {to_scan_cnt}')
             if not to_scan_cnt:
+                await self.on_completed(w)
                 return
+            # request each scripthash once, even if present in several scans
+            sh_targets = defaultdict(list)
+            for s in scans:
+                for i, addr in s.addrs.items():
+                    if i in s.balances:
+                        continue
+                    script = bitcoin.address_to_script(addr)
+                    scripthash = bitcoin.script_to_scripthash(script)
+                    sh_targets[scripthash].append((s, i))
+            sh_cnt = len(sh_targets)
             async with TaskGroup() as group:
-                for s in scans:
-                    for i, addr in s.addrs.items():
-                        if i in s.balances:
-                            continue
-                        script = bitcoin.address_to_script(addr)
-                        scripthash = bitcoin.script_to_scripthash(script)
-                        coro = n.get_balance_for_scripthash(scripthash)
-                        s.tasks[i] = await group.spawn(coro)
+                for scripthash, targets in sh_targets.items():
+                    coro = n.get_balance_for_scripthash(scripthash)
+                    task = await group.spawn(coro)
+                    for s, i in targets:
+                        s.tasks[i] = task
+                    task.add_done_callback(partial(self.on_balance_done,
+                                                   targets))
                 while True:
                     task = await group.next_done()
                     if task is None:
                         break
                     done_cnt += 1
-                    await self.on_progress(w, 100*done_cnt/to_scan_cnt)
-            for s in  scans:
-                for i, task in s.tasks.items():
-                    try:
-                        balance = task.result()
-                        s.balances[i] = balance_total(**balance)
-                        if i in s.errors:
-                            s.errors.pop(i)
-                    except BaseException as e:
-                        self.logger.info(f'Exception on get_balance {repr(e)}')
-                        s.errors[i] = e
-                s.tasks.clear()
+                    await self.on_progress(w, 100*done_cnt/sh_cnt)
             await self.on_completed(w)
         except Exception as e:
             self.logger.info(f'Exception during wallet_scan: {repr(e)}')
@@ -246,7 +267,7 @@ class ScanOverGapPlugin(BasePlugin, Logger):
                 if not ws or ws.running:
                     return
                 ws.running = True
-                scans = list(ws.scans.values())
+                scans = [s for s in ws.scan_list if s.has_found]
                 for s in scans:
                     await loop.run_in_executor(None, s.create_new_addrs, w)
             await self.on_completed(w)
@@ -2,8 +2,13 @@ import unittest
 import threading
 import tempfile
 import shutil
+from unittest import mock
+from functools import lru_cache
+from typing import Dict
 
-from electrum_zcash import constants
+from electrum_zcash import constants, util, wallet
+from electrum_zcash.mnemonic import Mnemonic
+from electrum_zcash.simple_config import SimpleConfig
 
 
 # Set this locally to make the test suite run faster.
@@ -30,9 +35,12 @@ class SequentialTestCase(unittest.TestCase):
 class ElectrumTestCase(SequentialTestCase):
     """Base class for our unit tests."""
 
+    # parent directory for electrum_path, None means system default
+    TEMP_DIR = None
+
     def setUp(self):
         super().setUp()
-        self.electrum_path = tempfile.mkdtemp()
+        self.electrum_path = tempfile.mkdtemp(dir=self.TEMP_DIR)
 
     def tearDown(self):
         super().tearDown()
@@ -50,3 +58,80 @@ class TestCaseForTestnet(ElectrumTestCase):
     def tearDownClass(cls):
         super().tearDownClass()
         constants.set_mainnet()
+
+
+class TestCaseForRegtest(ElectrumTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        constants.set_regtest()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        constants.set_mainnet()
+
+
+class EventLoopMixin:
+    """Runs an asyncio event loop thread, as cls.asyncio_loop,
+    for the whole test class."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        try:
+            cls.asyncio_loop, cls._stop_loop, cls._loop_thread = util.create_and_start_event_loop()
+        except BaseException:
+            # tearDownClass is not run if setUpClass fails
+            super().tearDownClass()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.asyncio_loop.call_soon_threadsafe(cls._stop_loop.set_result, 1)
+        cls._loop_thread.join(timeout=1)
+        super().tearDownClass()
+
+
+# the test classes restore wallets from the same seeds,
+# run the seed stretching (PBKDF2) only once per seed and passphrase
+_cached_mnemonic_to_seed = lru_cache(maxsize=None)(Mnemonic.mnemonic_to_seed)
+
+
+class RestoredWalletsMixin(EventLoopMixin):
+    """Restores the wallets of _restore_wallets once per test class, as cls._wallets.
+
+    The wallets are only read by the tests: they are never written to disk,
+    and each class gets its own directory, so classes can run in parallel.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._wallets_path = tempfile.mkdtemp()
+        cls._save_db_patcher = mock.patch.object(wallet.Abstract_Wallet, 'save_db')
+        cls._save_db_patcher.start()
+        try:
+            config = SimpleConfig({'electrum_path': cls._wallets_path})
+            with mock.patch.object(Mnemonic, 'mnemonic_to_seed',
+                                   staticmethod(_cached_mnemonic_to_seed)):
+                cls._wallets = cls._restore_wallets(config)
+        except BaseException:
+            # tearDownClass is not run if setUpClass fails: undo everything set up so far
+            cls._save_db_patcher.stop()
+            shutil.rmtree(cls._wallets_path)
+            super().tearDownClass()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._save_db_patcher.stop()
+        shutil.rmtree(cls._wallets_path)
+        super().tearDownClass()
+
+    @classmethod
+    def _restore_wallets(cls, config: SimpleConfig) -> Dict[str, 'wallet.Abstract_Wallet']:
+        """Returns the wallets of the class, keyed by name.
+        Their files go in cls._wallets_path."""
+        raise NotImplementedError()
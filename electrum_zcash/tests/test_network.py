@@ -9,7 +9,7 @@ from electrum_zcash.interface import Interface, ServerAddr
 from electrum_zcash.crypto import sha256
 from electrum_zcash.util import bh2u
 
-from . import ElectrumTestCase
+from . import TestCaseForRegtest
 
 
 class MockTaskGroup:
@@ -38,17 +38,7 @@ class MockInterface(Interface):
         assert assert_mode in item['mock'], (assert_mode, item)
         return item
 
-class TestNetwork(ElectrumTestCase):
-
-    @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        constants.set_regtest()
-
-    @classmethod
-    def tearDownClass(cls):
-        super().tearDownClass()
-        constants.set_mainnet()
+class TestNetwork(TestCaseForRegtest):
 
     def setUp(self):
         super().setUp()
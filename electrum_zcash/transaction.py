@@ -261,7 +261,7 @@ class BCDataStream(object):
         if self.input is None:
             self.input = bytearray(_bytes)
         else:
-            self.input += bytearray(_bytes)
+            self.input += _bytes  # extends in place, no temporary copy
 
     def read_string(self, encoding='ascii'):
         # Strings are encoded depending on length:
@@ -334,13 +334,14 @@ class BCDataStream(object):
         try:
             size = self.input[self.read_cursor]
             self.read_cursor += 1
-            if size == 253:
-                size = self._read_num('<H')
+            if size < 253:  # by far the most common case
+                return size
+            elif size == 253:
+                return self._read_num('<H')
             elif size == 254:
-                size = self._read_num('<I')
-            elif size == 255:
-                size = self._read_num('<Q')
-            return size
+                return self._read_num('<I')
+            else:
+                return self._read_num('<Q')
         except IndexError as e:
             raise SerializationError("attempt to read past end of buffer") from e
 
@@ -349,15 +350,13 @@ class BCDataStream(object):
             raise SerializationError("attempt to write size < 0")
         elif size < 253:
             self.write(bytes([size]))
+        # prefix and payload are packed together, to append to input once
         elif size < 2**16:
-            self.write(b'\xfd')
-            self._write_num('<H', size)
+            self.write(struct.pack('<BH', 253, size))
         elif size < 2**32:
-            self.write(b'\xfe')
-            self._write_num('<I', size)
+            self.write(struct.pack('<BI', 254, size))
         elif size < 2**64:
-            self.write(b'\xff')
-            self._write_num('<Q', size)
+            self.write(struct.pack('<BQ', 255, size))
         else:
             raise Exception(f"size {size} too large for compact_size")
 
@@ -448,34 +447,48 @@ def match_script_against_template(script, template) -> bool:
             return False
     return True
 
+
+class _ScriptPubkeyLayout(NamedTuple):
+    prefix: bytes
+    suffix: bytes
+    script_type: str
+    hash160_to_address: Callable[..., str]
+
+
+# The templates above can only be matched by a direct 20-byte push,
+# so each one corresponds to a single byte layout of fixed length.
+_SCRIPTPUBKEY_LAYOUTS = {  # type: Dict[int, _ScriptPubkeyLayout]
+    25: _ScriptPubkeyLayout(bytes([opcodes.OP_DUP, opcodes.OP_HASH160, 20]),
+                            bytes([opcodes.OP_EQUALVERIFY, opcodes.OP_CHECKSIG]),
+                            'p2pkh', hash160_to_p2pkh),
+    23: _ScriptPubkeyLayout(bytes([opcodes.OP_HASH160, 20]),
+                            bytes([opcodes.OP_EQUAL]),
+                            'p2sh', hash160_to_p2sh),
+}
+
+
+def _match_scriptpubkey_layout(_bytes: bytes) -> Optional[_ScriptPubkeyLayout]:
+    layout = _SCRIPTPUBKEY_LAYOUTS.get(len(_bytes))
+    if (layout is not None
+            and _bytes.startswith(layout.prefix)
+            and _bytes.endswith(layout.suffix)):
+        return layout
+    return None
+
+
 def get_script_type_from_output_script(_bytes: bytes) -> Optional[str]:
     if _bytes is None:
         return None
-    try:
-        decoded = [x for x in script_GetOp(_bytes)]
-    except MalformedBitcoinScript:
-        return None
-    if match_script_against_template(decoded, SCRIPTPUBKEY_TEMPLATE_P2PKH):
-        return 'p2pkh'
-    if match_script_against_template(decoded, SCRIPTPUBKEY_TEMPLATE_P2SH):
-        return 'p2sh'
-    return None
+    layout = _match_scriptpubkey_layout(_bytes)
+    return layout.script_type if layout else None
+
 
 def get_address_from_output_script(_bytes: bytes, *, net=None) -> Optional[str]:
-    try:
-        decoded = [x for x in script_GetOp(_bytes)]
-    except MalformedBitcoinScript:
+    layout = _match_scriptpubkey_layout(_bytes)
+    if layout is None:
         return None
-
-    # p2pkh
-    if match_script_against_template(decoded, SCRIPTPUBKEY_TEMPLATE_P2PKH):
-        return hash160_to_p2pkh(decoded[2][1], net=net)
-
-    # p2sh
-    if match_script_against_template(decoded, SCRIPTPUBKEY_TEMPLATE_P2SH):
-        return hash160_to_p2sh(decoded[1][1], net=net)
-
-    return None
+    h160 = bytes(_bytes[len(layout.prefix):-len(layout.suffix)])
+    return layout.hash160_to_address(h160, net=net)
 
 
 def parse_input(vds: BCDataStream) -> TxInput:
@@ -507,6 +520,12 @@ def multisig_script(public_keys: Sequence[str], m: int) -> str:
 
 
 
+class ZIP243SharedTxDigestFields(NamedTuple):
+    hashPrevouts: str
+    hashSequence: str
+    hashOutputs: str
+
+
 class Transaction:
     _cached_network_ser: Optional[str]
 
@@ -590,7 +609,9 @@ class Transaction:
 
         raw_bytes = bfh(self._cached_network_ser)
         vds = BCDataStream()
-        vds.write(raw_bytes)
+        # read from the immutable bytes as they are: no copy into a
+        # bytearray, and read_bytes can return the slices without another one
+        vds.clear_and_set_bytes(raw_bytes)
         Transaction.read_vds(vds, alone_data=True, tx=self)
 
     @classmethod
@@ -834,7 +855,9 @@ class Transaction:
             if not self.is_complete():
                 return None
             try:
-                ser = self.serialize_to_network()
+                # complete, so this is the network serialization; reuse
+                # (or fill) the cache instead of serializing again
+                ser = Transaction.serialize(self)
             except UnknownTxinType:
                 # we might not know how to construct scriptSig for some scripts
                 return None
@@ -897,9 +920,10 @@ class Transaction:
 
     def estimated_weight(self):
         """Return an estimate of transaction weight."""
+        # there is no witness data, base size is the same as total size,
+        # so serialize (estimate) only once
         total_tx_size = self.estimated_total_size()
-        base_tx_size = self.estimated_base_size()
-        return 3 * base_tx_size + total_tx_size
+        return 4 * total_tx_size
 
     def is_complete(self) -> bool:
         return True
@@ -953,6 +977,13 @@ def convert_raw_tx_to_hex(raw: Union[str, bytes]) -> str:
         raise ValueError("empty string")
     raw_unstripped = raw
     raw = raw.strip()
+    # try base64 first: its psbt prefix can be neither hex nor base43,
+    # so there is no need to probe the other encodings for it
+    if raw[0:6] in ('cHNidP', b'cHNidP'):  # base64 psbt
+        try:
+            return binascii.a2b_base64(raw).hex()
+        except:
+            pass
     # try hex
     try:
         return binascii.unhexlify(raw).hex()
@@ -963,12 +994,6 @@ def convert_raw_tx_to_hex(raw: Union[str, bytes]) -> str:
         return base_decode(raw, base=43).hex()
     except:
         pass
-    # try base64
-    if raw[0:6] in ('cHNidP', b'cHNidP'):  # base64 psbt
-        try:
-            return base64.b64decode(raw).hex()
-        except:
-            pass
     # raw bytes (do not strip whitespaces in this case)
     if isinstance(raw_unstripped, bytes):
         return raw_unstripped.hex()
@@ -979,6 +1004,9 @@ def tx_from_any(raw: Union[str, bytes], *,
                 deserialize: bool = True) -> Union['PartialTransaction', 'Transaction']:
     if isinstance(raw, bytearray):
         raw = bytes(raw)
+    if isinstance(raw, bytes) and raw[:5] == b'psbt\xff':
+        # raw psbt: parse as is, no need to probe encodings and go via hex
+        return PartialTransaction.from_raw_psbt(raw)
     raw = convert_raw_tx_to_hex(raw)
     try:
         return PartialTransaction.from_raw_psbt(raw)
@@ -1453,7 +1481,7 @@ class PartialTransaction(Transaction):
         if raw[0:10].lower() in (b'70736274ff', '70736274ff'):  # hex
             raw = bytes.fromhex(raw)
         elif raw[0:6] in (b'cHNidP', 'cHNidP'):  # base64
-            raw = base64.b64decode(raw)
+            raw = binascii.a2b_base64(raw)  # what b64decode calls, minus the wrapper
         if not isinstance(raw, (bytes, bytearray)) or raw[0:5] != b'psbt\xff':
             raise BadHeaderMagic("bad magic")
 
@@ -1660,7 +1688,21 @@ class PartialTransaction(Transaction):
         except MissingTxInputAmount:
             return None
 
-    def serialize_preimage(self, txin_index: int) -> str:
+    def _calc_zip243_shared_txdigest_fields(self) -> ZIP243SharedTxDigestFields:
+        inputs = self.inputs()
+        outputs = self.outputs()
+        s_prevouts = b''.join(txin.prevout.serialize_to_network() for txin in inputs)
+        hashPrevouts = blake2b(s_prevouts, digest_size=32, person=b'ZcashPrevoutHash').hexdigest()
+        s_sequences = bfh(''.join(int_to_hex(txin.nsequence, 4) for txin in inputs))
+        hashSequence = blake2b(s_sequences, digest_size=32, person=b'ZcashSequencHash').hexdigest()
+        s_outputs = b''.join(o.serialize_to_network() for o in outputs)
+        hashOutputs = blake2b(s_outputs, digest_size=32, person=b'ZcashOutputsHash').hexdigest()
+        return ZIP243SharedTxDigestFields(hashPrevouts=hashPrevouts,
+                                          hashSequence=hashSequence,
+                                          hashOutputs=hashOutputs)
+
+    def serialize_preimage(self, txin_index: int, *,
+                           zip243_shared_txdigest_fields: ZIP243SharedTxDigestFields = None) -> str:
         overwintered = self.overwintered
         version = self.version
         nLocktime = int_to_hex(self.locktime, 4)
@@ -1675,12 +1717,11 @@ class PartialTransaction(Transaction):
         if overwintered:
             nHeader = int_to_hex(0x80000000 | version, 4)
             nVersionGroupId = int_to_hex(self.versionGroupId, 4)
-            s_prevouts = bfh(''.join(txi.prevout.serialize_to_network().hex() for txi in inputs))
-            hashPrevouts = blake2b(s_prevouts, digest_size=32, person=b'ZcashPrevoutHash').hexdigest()
-            s_sequences = bfh(''.join(int_to_hex(txi.nsequence, 4) for txi in inputs))
-            hashSequence = blake2b(s_sequences, digest_size=32, person=b'ZcashSequencHash').hexdigest()
-            s_outputs = bfh(''.join(o.serialize_to_network().hex() for o in outputs))
-            hashOutputs = blake2b(s_outputs, digest_size=32, person=b'ZcashOutputsHash').hexdigest()
+            if zip243_shared_txdigest_fields is None:
+                zip243_shared_txdigest_fields = self._calc_zip243_shared_txdigest_fields()
+            hashPrevouts = zip243_shared_txdigest_fields.hashPrevouts
+            hashSequence = zip243_shared_txdigest_fields.hashSequence
+            hashOutputs = zip243_shared_txdigest_fields.hashOutputs
             joinSplits = self.joinSplits
             hashJoinSplits = '00'*32
             hashShieldedSpends = '00'*32
@@ -1708,6 +1749,9 @@ class PartialTransaction(Transaction):
 
     def sign(self, keypairs) -> int:
         # keypairs:  pubkey_hex -> (secret_bytes, is_compressed)
+        zip243_shared_txdigest_fields = None
+        if self.overwintered:
+            zip243_shared_txdigest_fields = self._calc_zip243_shared_txdigest_fields()
         signed_txins_cnt = 0
         for i, txin in enumerate(self.inputs()):
             pubkeys = [pk.hex() for pk in txin.pubkeys]
@@ -1718,7 +1762,7 @@ class PartialTransaction(Transaction):
                     continue
                 _logger.info(f"adding signature for {pubkey}")
                 sec, compressed = keypairs[pubkey]
-                sig = self.sign_txin(i, sec)
+                sig = self.sign_txin(i, sec, zip243_shared_txdigest_fields=zip243_shared_txdigest_fields)
                 self.add_signature_to_txin(txin_idx=i, signing_pubkey=pubkey, sig=sig)
                 signed_txins_cnt += 1
 
@@ -1726,11 +1770,13 @@ class PartialTransaction(Transaction):
         self.invalidate_ser_cache()
         return signed_txins_cnt
 
-    def sign_txin(self, txin_index, privkey_bytes) -> str:
+    def sign_txin(self, txin_index, privkey_bytes, *,
+                  zip243_shared_txdigest_fields: ZIP243SharedTxDigestFields = None) -> str:
         txin = self.inputs()[txin_index]
         txin.validate_data(for_signing=True)
         if self.overwintered:
-            data = bfh(self.serialize_preimage(txin_index))
+            data = bfh(self.serialize_preimage(txin_index,
+                                               zip243_shared_txdigest_fields=zip243_shared_txdigest_fields))
             person = b'ZcashSigHash' + CANOPY_BRANCH_ID.to_bytes(4, 'little')
             pre_hash = blake2b(data, digest_size=32, person=person).digest()
         else:
@@ -1786,13 +1832,16 @@ class PartialTransaction(Transaction):
             return
         if len(self.inputs()) != len(signatures):
             raise Exception('expected {} signatures; got {}'.format(len(self.inputs()), len(signatures)))
+        zip243_shared_txdigest_fields = None
+        if self.overwintered:
+            zip243_shared_txdigest_fields = self._calc_zip243_shared_txdigest_fields()
         for i, txin in enumerate(self.inputs()):
             pubkeys = [pk.hex() for pk in txin.pubkeys]
             sig = signatures[i]
             if bfh(sig) in list(txin.part_sigs.values()):
                 continue
             if self.overwintered:
-                data = bfh(self.serialize_preimage(i))
+                data = bfh(self.serialize_preimage(i, zip243_shared_txdigest_fields=zip243_shared_txdigest_fields))
                 person = b'ZcashSigHash' + CANOPY_BRANCH_ID.to_bytes(4, 'little')
                 pre_hash = blake2b(data, digest_size=32, person=person).digest()
             else:
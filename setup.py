@@ -83,6 +83,10 @@ setup(
     # package_data kwarg lists what gets put in site-packages when pip installing the tar.gz.
     # By specifying include_package_data=True, MANIFEST.in becomes responsible for both.
     include_package_data=True,
+    # the unit tests are shipped in the tar.gz, but are not installed
+    exclude_package_data={
+        'electrum_zcash': ['tests/*'],
+    },
     scripts=['electrum_zcash/electrum-zcash'],
     data_files=data_files,
     description="Lightweight Zcash Wallet",